@@ -1,11 +1,16 @@
 # coding=utf-8
 
 import html
+import json
 import logging
-import mimetypes
+import os
 import time
+from contextlib import suppress
+from functools import lru_cache
 from gettext import NullTranslations, translation
-from typing import Optional, List, Callable
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Optional, List, Callable, Tuple
 from xmlrpc.server import SimpleXMLRPCServer
 
 import telegram  # lgtm [py/import-and-import-from]
@@ -31,6 +36,7 @@ from ehforwarderbot.status import ReactToMessage
 from ehforwarderbot.types import ModuleID, InstanceID, MessageID, ReactionName, ChatID
 from . import utils as etm_utils
 from .__version__ import __version__
+from .admin_notifier import AdminNotifier
 from .auto_tg_manager import AutoTGManager
 from .bot_manager import TelegramBotManager
 from .chat_binding import ChatBindingManager
@@ -45,6 +51,74 @@ from .slave_message import SlaveMessageProcessor
 from .utils import ExperimentalFlagsManager, EFBChannelChatIDStr, TelegramChatID, TelegramMessageID
 
 
+def _gettext_noop(s: str) -> str:
+    """Mark a string for translation without translating it at this point."""
+    return s
+
+
+@lru_cache(maxsize=4096)
+def _chat_id_to_str(channel_id: ModuleID, chat_uid: ChatID) -> EFBChannelChatIDStr:
+    """Memoized :func:`.utils.chat_id_to_str` for a channel and chat ID pair."""
+    return etm_utils.chat_id_to_str(channel_id, chat_uid)
+
+
+@lru_cache(maxsize=4096)
+def _chat_id_str_to_id(s: EFBChannelChatIDStr) -> Tuple[ModuleID, ChatID, Optional[ChatID]]:
+    """Memoized :func:`.utils.chat_id_str_to_id`."""
+    return etm_utils.chat_id_str_to_id(s)
+
+
+_CONFLICT_MSG = "make sure that only one bot instance is running"
+"""Part of the error message from Telegram when polling is conflicted."""
+
+
+def _fmt_err(err_s: str, upd_s: str) -> Tuple[str, str]:
+    """Escape an error and the update causing it for HTML."""
+    return html.escape(err_s), html.escape(upd_s)
+
+
+_BAD_REQUEST_ADMIN_FMT = _gettext_noop("Message request is invalid.\n{error}\n"
+                                       "<code>{update}</code>")
+"""Translatable text of the notification to admin on invalid requests."""
+
+_NETWORK_ERR_REPLY_FMT = _gettext_noop("This message is not processed due to poor internet environment "
+                                       "of the server.\n"
+                                       "<code>{code}</code>")
+"""Translatable text of the reply to a message not processed due to network errors."""
+
+_GENERIC_ERR_FMT = _gettext_noop("EFB Telegram Master channel encountered error <code>{error}</code> "
+                                 "caused by update <code>{update}</code>. See log for details.")
+"""Translatable text of the notification to admin on unhandled errors."""
+
+_START_TEXT = _gettext_noop("This is EFB Telegram Master Channel.\n\n"
+                            "To learn more, please visit https://etm.1a23.studio .")
+"""Translatable text of the reply to ``/start`` without arguments."""
+
+_HELP_TEXT = _gettext_noop("EFB Telegram Master Channel\n"
+                           "/link\n"
+                           "    Link a remote chat to an empty Telegram group.\n"
+                           "    Followed by a regular expression to filter results.\n"
+                           "/chat\n"
+                           "    Generate a chat head to start a conversation.\n"
+                           "    Followed by a regular expression to filter results.\n"
+                           "/extra\n"
+                           "    List all additional features from slave channels.\n"
+                           "/unlink_all\n"
+                           "    Unlink all remote chats in this chat.\n"
+                           "/info\n"
+                           "    Show information of the current Telegram chat.\n"
+                           "/react [emoji]\n"
+                           "    React to a message with an emoji, or show a list of members reacted.\n"
+                           "/update_info\n"
+                           "    Update info of linked Telegram group.\n"
+                           "    Only works in singly linked group where the bot is an admin.\n"
+                           "/rm\n"
+                           "    Remove the quoted message from its remote chat.\n"
+                           "/help\n"
+                           "    Print this command list.")
+"""Translatable text of the reply to ``/help``."""
+
+
 class TelegramChannel(MasterChannel):
     """
     EFB Channel - Telegram (Master)
@@ -82,6 +156,7 @@ class TelegramChannel(MasterChannel):
 
     # Constants
     config: dict
+    first_admin: int
 
     # Translator
     translator: NullTranslations = translation("efb_telegram_master",
@@ -117,15 +192,14 @@ class TelegramChannel(MasterChannel):
         # Load configs
         self.load_config()
 
-        # Load predefined MIME types
-        mimetypes.init(files=["mimetypes"])
-
         # Initialize managers
         self.flag: ExperimentalFlagsManager = ExperimentalFlagsManager(self)
+        self.refresh_flags()
         self.db: DatabaseManager = DatabaseManager(self)
         self.chat_manager: ChatObjectCacheManager = ChatObjectCacheManager(self)
         self.chat_dest_cache: ChatDestinationCache = ChatDestinationCache(self.flag("send_to_last_chat"))
         self.bot_manager: TelegramBotManager = TelegramBotManager(self)
+        self._admin_notifier: AdminNotifier = AdminNotifier(self, self.first_admin)
         self.commands: CommandsManager = CommandsManager(self)
         self.chat_binding: ChatBindingManager = ChatBindingManager(self)
         self.auto_tg_manager: AutoTGManager = AutoTGManager(self)
@@ -137,29 +211,30 @@ class TelegramChannel(MasterChannel):
                                           fallback=True)
 
         # Basic message handlers
+        dispatcher = self.bot_manager.dispatcher
         non_edit_filter = Filters.update.message | Filters.update.channel_post
-        self.bot_manager.dispatcher.add_handler(
-            CommandHandler("start", self.start, filters=non_edit_filter))
-        self.bot_manager.dispatcher.add_handler(
-            CommandHandler("help", self.help, filters=non_edit_filter))
-        self.bot_manager.dispatcher.add_handler(
-            CommandHandler("info", self.info, filters=non_edit_filter))
-        self.bot_manager.dispatcher.add_handler(
-            CallbackQueryHandler(self.void_callback_handler, pattern="void"))
-        self.bot_manager.dispatcher.add_handler(
-            CallbackQueryHandler(self.bot_manager.session_expired))
-        self.bot_manager.dispatcher.add_handler(
-            CommandHandler("react", self.react, filters=non_edit_filter)
-        )
+        for handler in (
+                CommandHandler("start", self.start, filters=non_edit_filter),
+                CommandHandler("help", self.help, filters=non_edit_filter),
+                CommandHandler("info", self.info, filters=non_edit_filter),
+                CallbackQueryHandler(self.void_callback_handler, pattern="void"),
+                CallbackQueryHandler(self.bot_manager.session_expired),
+                CommandHandler("react", self.react, filters=non_edit_filter),
+        ):
+            dispatcher.add_handler(handler)
 
         # Register master message handlers after commands to prevent commands
         # commands to be delivered as messages
         self.master_messages: MasterMessageProcessor = MasterMessageProcessor(self)
 
-        self.bot_manager.dispatcher.add_error_handler(self.error)
+        dispatcher.add_error_handler(self.error)
 
         self.rpc_utilities = RPCUtilities(self)
 
+    def refresh_flags(self):
+        """Reload flag values cached on the channel."""
+        self._network_error_prompt_interval: int = self.flag('network_error_prompt_interval')
+
     @property
     def _(self) -> Callable[[str], str]:
         return self.translator.gettext
@@ -177,26 +252,107 @@ class TelegramChannel(MasterChannel):
         config_path = efb_utils.get_config_path(self.channel_id)
         if not config_path.exists():
             raise FileNotFoundError(self._("Config File does not exist. ({path})").format(path=config_path))
+        data = self._read_config_data(config_path)
+
+        # Verify configuration
+        if not isinstance(data.get('token', None), str):
+            raise ValueError(self._('Telegram bot token must be a string'))
+        admins = data.get('admins')
+        admins_type = type(admins)
+        if admins_type is int:
+            admins = [admins]
+        elif admins_type is str and admins.isdigit():
+            admins = [int(admins)]
+        elif admins_type is not list or not admins:
+            raise ValueError(self._("Admins' user IDs must be a list of one number or more."))
+        for i, admin in enumerate(admins):
+            if isinstance(admin, str) and admin.isdigit():
+                admin = admins[i] = int(admin)
+            if not isinstance(admin, int):
+                raise ValueError(self._('Admin ID is expected to be an int, but {data} is found.')
+                                 .format(data=admin))
+        data['admins'] = tuple(admins)
+
+        self.config = data
+        self.first_admin = data['admins'][0]
+
+    @staticmethod
+    def _get_folder_config(data: dict) -> Optional[dict]:
+        """Get ``auto_add_group_to_folder`` mapping from raw config data, if any."""
+        flags = data.get('flags')
+        tg_config = flags.get('auto_manage_tg_config') if isinstance(flags, dict) else None
+        folders = tg_config.get('auto_add_group_to_folder') if isinstance(tg_config, dict) else None
+        return folders if isinstance(folders, dict) else None
+
+    def _read_config_data(self, config_path: Path) -> dict:
+        """
+        Read raw configuration data from the YAML file.
+
+        Parsed data is cached in a JSON file next to the config, along
+        with the modification time and size of the YAML file, and is
+        reused only when both of them match exactly. Integer keys of
+        ``auto_add_group_to_folder`` are stored as strings in the cache
+        and restored on load. Configs that cannot be represented
+        losslessly in JSON otherwise are not cached.
+        """
+        cache_path = config_path.with_name(config_path.name + ".cache.json")
+        stat = config_path.stat()
+        cache = None
+        with suppress(OSError, ValueError):
+            with cache_path.open() as f:
+                cache = json.load(f)
+        if isinstance(cache, dict) and cache.get('mtime_ns') == stat.st_mtime_ns \
+                and cache.get('size') == stat.st_size and isinstance(cache.get('config'), dict):
+            data = cache['config']
+            int_keys = cache.get('folder_int_keys') or []
+            folders = self._get_folder_config(data)
+            if not int_keys:
+                return data
+            if folders is not None and all(str(key) in folders for key in int_keys):
+                for key in int_keys:
+                    folders[key] = folders.pop(str(key))
+                return data
+
         with config_path.open() as f:
-            data = YAML().load(f)
-
-            # Verify configuration
-            if not isinstance(data.get('token', None), str):
-                raise ValueError(self._('Telegram bot token must be a string'))
-            if isinstance(data.get('admins', None), int):
-                data['admins'] = [data['admins']]
-            if isinstance(data.get('admins', None), str) and data['admins'].isdigit():
-                data['admins'] = [int(data['admins'])]
-            if not isinstance(data.get('admins', None), list) or not data['admins']:
-                raise ValueError(self._("Admins' user IDs must be a list of one number or more."))
-            for i in range(len(data['admins'])):
-                if isinstance(data['admins'][i], str) and data['admins'][i].isdigit():
-                    data['admins'][i] = int(data['admins'][i])
-                if not isinstance(data['admins'][i], int):
-                    raise ValueError(self._('Admin ID is expected to be an int, but {data} is found.')
-                                     .format(data=data['admins'][i]))
-
-            self.config = data.copy()
+            # Safe loader uses the LibYAML-backed C parser when it is
+            # available, and falls back to the pure Python one otherwise.
+            data = YAML(typ='safe').load(f)
+        if not isinstance(data, dict):
+            return data
+
+        tmp_path: Optional[str] = None
+        try:
+            cached = data
+            int_keys = None
+            folders = self._get_folder_config(data)
+            if folders:
+                int_keys = [k for k in folders if isinstance(k, int)]
+                if int_keys:
+                    # Shallow copies down to the folder mapping, leaving
+                    # ``data`` untouched.
+                    cached = dict(data, flags=dict(data['flags']))
+                    tg_config = cached['flags']['auto_manage_tg_config'] = \
+                        dict(data['flags']['auto_manage_tg_config'])
+                    tg_config['auto_add_group_to_folder'] = {
+                        str(k) if isinstance(k, int) else k: v for k, v in folders.items()
+                    }
+            dumped = json.dumps(cached)
+            if json.loads(dumped) != cached:
+                return data
+            # Write to a temporary file first and rename it to keep the
+            # cache atomic.
+            with NamedTemporaryFile("w", dir=str(cache_path.parent), prefix=cache_path.name,
+                                    suffix=".tmp", delete=False) as tmp:
+                tmp_path = tmp.name
+                json.dump({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                           "folder_int_keys": int_keys, "config": cached}, tmp)
+            os.replace(tmp_path, str(cache_path))
+        except (TypeError, ValueError, OSError) as e:
+            self.logger.debug("Failed to cache config to %s: %s", cache_path, e)
+            if tmp_path:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+        return data
 
     def info(self, update: Update, context: CallbackContext):
         """
@@ -237,24 +393,23 @@ class TelegramChannel(MasterChannel):
                     "on EFB {fw_version}.")
         msg = msg.format(version=self.__version__, fw_version=ehforwarderbot.__version__,
                          profile=coordinator.profile, instance=self.instance_id)
-        msg += "\n" + self.ngettext("{count} slave channel activated:",
-                                    "{count} slave channels activated:",
-                                    len(coordinator.slaves)).format(count=len(coordinator.slaves))
-        for i in coordinator.slaves:
-            msg += "\n- %s %s (%s, %s)" % (coordinator.slaves[i].channel_emoji,
-                                           coordinator.slaves[i].channel_name,
-                                           i, coordinator.slaves[i].__version__)
+        parts = [msg, "\n", self.ngettext("{count} slave channel activated:",
+                                          "{count} slave channels activated:",
+                                          len(coordinator.slaves)).format(count=len(coordinator.slaves))]
+        for i, slave in coordinator.slaves.items():
+            parts.append("\n- %s %s (%s, %s)" % (slave.channel_emoji, slave.channel_name,
+                                                 i, slave.__version__))
         if coordinator.middlewares:
-            msg += self.ngettext("\n\n{count} middleware activated:", "\n\n{count} middlewares activated:",
-                                 len(coordinator.middlewares)).format(count=len(coordinator.middlewares))
+            parts.append(self.ngettext("\n\n{count} middleware activated:", "\n\n{count} middlewares activated:",
+                                       len(coordinator.middlewares)).format(count=len(coordinator.middlewares)))
             for i in coordinator.middlewares:
-                msg += "\n- %s (%s, %s)" % (i.middleware_name, i.middleware_id, i.__version__)
-        return msg
+                parts.append("\n- %s (%s, %s)" % (i.middleware_name, i.middleware_id, i.__version__))
+        return "".join(parts)
 
     def info_channel(self, update):
         """Generate string for chat linking info of a channel."""
         chat = update.effective_message.forward_from_chat
-        links = self.db.get_chat_assoc(master_uid=etm_utils.chat_id_to_str(self.channel_id, chat.id))
+        links = self.db.get_chat_assoc(master_uid=_chat_id_to_str(self.channel_id, chat.id))
         if links:  # Linked chat
             # TRANSLATORS: ‘channel’ here refers to a Telegram channel.
             msg = self._("The channel {group_name} ({group_id}) is linked to:") \
@@ -271,7 +426,7 @@ class TelegramChannel(MasterChannel):
 
     def info_group(self, update):
         """Generate string for chat linking info of a group."""
-        links = self.db.get_chat_assoc(master_uid=etm_utils.chat_id_to_str(self.channel_id, update.message.chat_id))
+        links = self.db.get_chat_assoc(master_uid=_chat_id_to_str(self.channel_id, update.message.chat_id))
         if links:  # Linked chat
             msg = self._("The group {group_name} ({group_id}) is linked to:").format(
                 group_name=update.message.chat.title,
@@ -289,13 +444,14 @@ class TelegramChannel(MasterChannel):
         Returns:
             String that starts with a line break.
         """
-        msg = ""
-        for i in links:
-            channel_id, chat_id, _ = etm_utils.chat_id_str_to_id(i)
-            chat_object = self.chat_manager.get_chat(channel_id, chat_id)
+        parts: List[str] = []
+        keys = [_chat_id_str_to_id(i)[:2] for i in links]
+        chat_objects = self.chat_manager.get_chats(keys)
+        for channel_id, chat_id in keys:
+            chat_object = chat_objects[(channel_id, chat_id)]
             if chat_object:
-                msg += "\n- %s (%s:%s)" % (chat_object.full_name,
-                                           channel_id, chat_id)
+                parts.append("\n- %s (%s:%s)" % (chat_object.full_name,
+                                                 channel_id, chat_id))
             else:
                 try:
                     module = coordinator.get_module_by_id(channel_id)
@@ -303,18 +459,18 @@ class TelegramChannel(MasterChannel):
                         channel_name = f"{module.channel_emoji} {module.channel_name}"
                     else:  # module is Middleware
                         channel_name = module.middleware_name
-                    msg += self._("\n- {channel_name}: Unknown chat ({channel_id}:{chat_id})").format(
+                    parts.append(self._("\n- {channel_name}: Unknown chat ({channel_id}:{chat_id})").format(
                         channel_name=channel_name,
                         channel_id=channel_id,
                         chat_id=chat_id
-                    )
+                    ))
                 except NameError:
                     # TRANSLATORS: ‘channel’ here means an EFB channel.
-                    msg += self._("\n- Unknown channel {channel_id}: ({chat_id})").format(
+                    parts.append(self._("\n- Unknown channel {channel_id}: ({chat_id})").format(
                         channel_id=channel_id,
                         chat_id=chat_id
-                    )
-        return msg
+                    ))
+        return "".join(parts)
 
     def start(self, update: Update, context: CallbackContext):
         """
@@ -332,9 +488,7 @@ class TelegramChannel(MasterChannel):
                 self.bot_manager.send_message(update.effective_chat.id,
                                               self._('You cannot link remote chats to here. Please try again.'))
         else:
-            txt = self._("This is EFB Telegram Master Channel.\n\n"
-                         "To learn more, please visit https://etm.1a23.studio .")
-            self.bot_manager.send_message(update.effective_chat.id, txt)
+            self.bot_manager.send_message(update.effective_chat.id, self._(_START_TEXT))
 
     def react(self, update: Update, context: CallbackContext):
         """React to a message."""
@@ -425,29 +579,7 @@ class TelegramChannel(MasterChannel):
     def help(self, update: Update, context: CallbackContext):
         assert isinstance(update, Update)
         assert isinstance(update.message, Message)
-        txt = self._("EFB Telegram Master Channel\n"
-                     "/link\n"
-                     "    Link a remote chat to an empty Telegram group.\n"
-                     "    Followed by a regular expression to filter results.\n"
-                     "/chat\n"
-                     "    Generate a chat head to start a conversation.\n"
-                     "    Followed by a regular expression to filter results.\n"
-                     "/extra\n"
-                     "    List all additional features from slave channels.\n"
-                     "/unlink_all\n"
-                     "    Unlink all remote chats in this chat.\n"
-                     "/info\n"
-                     "    Show information of the current Telegram chat.\n"
-                     "/react [emoji]\n"
-                     "    React to a message with an emoji, or show a list of members reacted.\n"
-                     "/update_info\n"
-                     "    Update info of linked Telegram group.\n"
-                     "    Only works in singly linked group where the bot is an admin.\n"
-                     "/rm\n"
-                     "    Remove the quoted message from its remote chat.\n"
-                     "/help\n"
-                     "    Print this command list.")
-        update.message.reply_text(txt)
+        update.message.reply_text(self._(_HELP_TEXT))
 
     def poll(self):
         """
@@ -462,7 +594,7 @@ class TelegramChannel(MasterChannel):
         """
         assert context.error
         error: Exception = context.error
-        if "make sure that only one bot instance is running" in str(error):
+        if isinstance(error, telegram.error.Conflict) and _CONFLICT_MSG in error.message:
             now = time.time()
             # Warn the user only from the second time within ``CONFLICTION_TIMEOUT``
             # seconds to suppress isolated warnings.
@@ -471,64 +603,58 @@ class TelegramChannel(MasterChannel):
                 msg = self._('Conflicted polling detected. If this error persists, '
                              'please ensure you are running only one instance of this Telegram bot.')
                 self.logger.critical(msg)
-                self.bot_manager.send_message(self.config['admins'][0], msg)
+                self.bot_manager.send_message(self.first_admin, msg)
             self.last_poll_confliction_time = now
             return
-        if "Invalid server response" in str(error) and not update:
+        if not update and "Invalid server response" in str(error):
             self.logger.error("Boom! Telegram API is no good. (Invalid server response.)")
             return
         # noinspection PyBroadException
         try:
             raise error
         except telegram.error.Unauthorized:
-            self.logger.error("The bot is not authorised to send update:\n%s\n%s", str(update), str(error))
+            self.logger.error("The bot is not authorised to send update:\n%s\n%s", update, error)
         except telegram.error.BadRequest as e:
             assert isinstance(update, Update)
             if e.message == "Message is not modified" and update.callback_query:
                 self.logger.error("Chill bro, don't click that fast.")
             else:
-                self.logger.exception("Message request is invalid.\n%s\n%s", str(update), str(error))
-                self.bot_manager.send_message(self.config['admins'][0],
-                                              self._("Message request is invalid.\n{error}\n"
-                                                     "<code>{update}</code>").format(
-                                                  error=html.escape(str(error)), update=html.escape(str(update))),
-                                              parse_mode="HTML")
+                self.logger.exception("Message request is invalid.\n%s\n%s", update, error)
+                err_h, upd_h = _fmt_err(str(error), str(update))
+                self._admin_notifier.notify(self._(_BAD_REQUEST_ADMIN_FMT).format(error=err_h, update=upd_h))
         except (telegram.error.TimedOut, telegram.error.NetworkError):
             self.timeout_count += 1
             self.logger.error("Poor internet connection detected.\n"
                               "Number of network error occurred since last startup: %s\n%s\nUpdate: %s",
-                              self.timeout_count, str(error), str(update))
+                              self.timeout_count, error, update)
             if isinstance(update, Update) and isinstance(update.message, Message):
-                update.message.reply_text(self._("This message is not processed due to poor internet environment "
-                                                 "of the server.\n"
-                                                 "<code>{code}</code>").format(code=html.escape(str(error))),
+                update.message.reply_text(self._(_NETWORK_ERR_REPLY_FMT).format(code=html.escape(str(error))),
                                           quote=True,
                                           parse_mode="HTML")
 
-            timeout_interval = self.flag('network_error_prompt_interval')
+            timeout_interval = self._network_error_prompt_interval
             if timeout_interval > 0 and self.timeout_count % timeout_interval == 0:
-                self.bot_manager.send_message(self.config['admins'][0],
-                                              self.ngettext("<b>EFB Telegram Master channel</b>\n"
-                                                            "You may have a poor internet connection on your server. "
-                                                            "Currently {count} network error is detected.\n"
-                                                            "For more details, please refer to the log.",
-                                                            "<b>EFB Telegram Master channel</b>\n"
-                                                            "You may have a poor internet connection on your server. "
-                                                            "Currently {count} network errors are detected.\n"
-                                                            "For more details, please refer to the log.",
-                                                            self.timeout_count).format(
-                                                  count=self.timeout_count),
-                                              parse_mode="HTML")
+                self._admin_notifier.notify(self.ngettext("<b>EFB Telegram Master channel</b>\n"
+                                                          "You may have a poor internet connection on your server. "
+                                                          "Currently {count} network error is detected.\n"
+                                                          "For more details, please refer to the log.",
+                                                          "<b>EFB Telegram Master channel</b>\n"
+                                                          "You may have a poor internet connection on your server. "
+                                                          "Currently {count} network errors are detected.\n"
+                                                          "For more details, please refer to the log.",
+                                                          self.timeout_count).format(
+                                                count=self.timeout_count))
         except telegram.error.ChatMigrated as e:
             assert isinstance(update, Update)
             new_id = e.new_chat_id
             assert isinstance(update.message, Message)
             old_id = ChatID(str(update.message.chat_id))
+            new_master_uid = _chat_id_to_str(self.channel_id, ChatID(str(new_id)))
             count = 0
-            for i in self.db.get_chat_assoc(master_uid=etm_utils.chat_id_to_str(self.channel_id, old_id)):
+            for i in self.db.get_chat_assoc(master_uid=_chat_id_to_str(self.channel_id, old_id)):
                 self.logger.debug('Migrating slave chat %s from Telegram chat %s to %s.', i, old_id, new_id)
                 self.db.remove_chat_assoc(slave_uid=i)
-                self.db.add_chat_assoc(master_uid=etm_utils.chat_id_to_str(self.channel_id, ChatID(str(new_id))), slave_uid=i)
+                self.db.add_chat_assoc(master_uid=new_master_uid, slave_uid=i)
                 count += 1
             self.bot_manager.send_message(
                 new_id, self.ngettext("Chat migration detected.\n"
@@ -538,15 +664,8 @@ class TelegramChannel(MasterChannel):
                                       count).format(count=count))
         except Exception:
             try:
-                self.bot_manager.send_message(
-                    self.config['admins'][0],
-                    self._(
-                        "EFB Telegram Master channel encountered error <code>{error}</code> "
-                        "caused by update <code>{update}</code>. See log for details.").format(
-                        error=html.escape(str(error)),
-                        update=html.escape(
-                            str(update))),
-                    parse_mode="HTML")
+                err_h, upd_h = _fmt_err(str(error), str(update))
+                self._admin_notifier.notify(self._(_GENERIC_ERR_FMT).format(error=err_h, update=upd_h))
             except Exception as ex:
                 self.logger.exception("Failed to send error message through Telegram: %s", ex)
 
@@ -583,6 +702,7 @@ class TelegramChannel(MasterChannel):
     def stop_polling(self):
         self.logger.debug("Gracefully stopping %s (%s).", self.channel_name, self.channel_id)
         self.rpc_utilities.shutdown()
+        self._admin_notifier.stop()
         self.bot_manager.graceful_stop()
         self.master_messages.stop_worker()
         self.db.stop_worker()
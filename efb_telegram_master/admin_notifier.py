@@ -0,0 +1,92 @@
+# coding: utf-8
+"""
+Coalesce error notifications sent to the admin.
+"""
+
+import logging
+import threading
+from typing import List, Optional, TYPE_CHECKING
+
+from .locale_mixin import LocaleMixin
+
+if TYPE_CHECKING:
+    from . import TelegramChannel
+
+ADMIN_NOTIFIER_MAX_SIZE = 20
+"""Number of notifications to be sent at most in one message."""
+ADMIN_NOTIFIER_MAX_DELAY = 2.0
+"""Number of seconds for a notification to wait before being sent."""
+
+
+class AdminNotifier(LocaleMixin):
+    """Buffer HTML notifications to an admin, and send them as one message
+    when ``max_delay`` seconds have passed since the first notification in
+    the buffer, or when ``max_size`` notifications are buffered.
+    """
+
+    def __init__(self, channel: 'TelegramChannel', admin_id: int,
+                 max_size: int = ADMIN_NOTIFIER_MAX_SIZE,
+                 max_delay: float = ADMIN_NOTIFIER_MAX_DELAY):
+        self.channel: 'TelegramChannel' = channel
+        self.admin_id = admin_id
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.logger = logging.getLogger(__name__)
+
+        self._buf: List[str] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def notify(self, html_snippet: str):
+        """Enqueue a notification in HTML to be sent to the admin.
+
+        Notifications are sent immediately once the notifier is stopped.
+        """
+        with self._lock:
+            stopped = self._stopped
+            full = False
+            if not stopped:
+                self._buf.append(html_snippet)
+                full = len(self._buf) >= self.max_size
+                if not full and self._timer is None:
+                    self._timer = threading.Timer(self.max_delay, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if stopped:
+            self._send(html_snippet)
+        elif full:
+            self._flush()
+
+    def stop(self):
+        """Send all pending notifications immediately, and stop buffering
+        further notifications.
+        """
+        with self._lock:
+            self._stopped = True
+        self._flush()
+
+    def _flush(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            buf, self._buf = self._buf, []
+        if not buf:
+            return
+        if len(buf) == 1:
+            text = buf[0]
+        else:
+            # Snippets carry their own header, thus not repeated here.
+            text = self.ngettext("{count} error is reported.",
+                                 "{count} errors are reported.",
+                                 len(buf)).format(count=len(buf))
+            text = "\n\n".join([text] + buf)
+        self._send(text)
+
+    def _send(self, text: str):
+        # noinspection PyBroadException
+        try:
+            self.channel.bot_manager.send_message(self.admin_id, text, parse_mode="HTML")
+        except Exception as e:
+            self.logger.exception("Failed to send error message through Telegram: %s", e)
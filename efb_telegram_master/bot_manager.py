@@ -5,7 +5,7 @@ import io
 import logging
 import os
 from functools import wraps
-from typing import List, TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Sequence
 
 import telegram.constants
 import telegram.error
@@ -29,7 +29,7 @@ class TelegramBotManager(LocaleMixin):
 
     Attributes:
         me (telegram.User): Telegram User
-        admins (List[int]): List of admin user IDs.
+        admins (Sequence[int]): List of admin user IDs.
         updater (telegram.ext.Updater): Updater of the bot
         dispatcher (telegram.ext.Dispatcher): Dispatcher of the updater
     """
@@ -169,7 +169,7 @@ class TelegramBotManager(LocaleMixin):
         assert me, "Invalid bot credential provided."
         self.me: User = me
         self.logger.debug("Connection to Telegram bot API is OK...")
-        self.admins: List[int] = config['admins']
+        self.admins: Sequence[int] = config['admins']
         self.dispatcher: Dispatcher = self.updater.dispatcher
         self.logger.debug("Adding base dispatchers...")
         # New whitelist handler
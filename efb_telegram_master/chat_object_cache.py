@@ -12,6 +12,7 @@ from .chat import convert_chat, ETMChatType, ETMChatMember, unpickle, ETMSystemC
 
 if TYPE_CHECKING:
     from . import TelegramChannel
+    from .db import SlaveChatInfo
 
 CacheKey = Tuple[ModuleID, ChatID]
 """Cache storage key: module_id, chat_id"""
@@ -93,6 +94,30 @@ class ChatObjectCacheManager:
             return self.cache[key]
 
         c_log = self.db.get_slave_chat_info(module_id, chat_id)
+        return self._build_chat(module_id, chat_id, c_log, build_dummy)
+
+    def get_chats(self, keys: Collection[CacheKey]) -> Dict[CacheKey, Optional[ETMChatType]]:
+        """
+        Get ETMChat objects of multiple chats from cache.
+
+        Same as :meth:`get_chat`, except that chats not found in cache are
+        looked up from database cache with a single query.
+        """
+        missing = [key for key in keys if key not in self.cache]
+        c_logs = self.db.get_slave_chats_info(missing) if missing else {}
+        result: Dict[CacheKey, Optional[ETMChatType]] = dict()
+        for key in keys:
+            if key in self.cache:
+                result[key] = self.cache[key]
+            else:
+                result[key] = self._build_chat(key[0], key[1], c_logs.get(key))
+        return result
+
+    def _build_chat(self, module_id: ModuleID, chat_id: ChatID, c_log: Optional['SlaveChatInfo'],
+                    build_dummy: bool = False) -> Optional[ETMChatType]:
+        """Build a chat object not found in cache from its database cache
+        entry, or from the relevant channel.
+        """
         if c_log is not None and c_log.pickle:
             # Suppress AttributeError caused by change of class name in EFB 2.0.0b26, ETM 2.0.0b40
             with suppress(AttributeError):
@@ -3,6 +3,7 @@
 import datetime
 import logging
 import pickle
+import threading
 import time
 from contextlib import suppress
 from functools import partial
@@ -177,6 +178,12 @@ class DatabaseManager:
     def __init__(self, channel: 'TelegramChannel'):
         base_path = utils.get_data_path(channel.channel_id)
 
+        # Cache of chat associations, keyed by ("master", master_uid) or
+        # ("slave", slave_uid). Cleared whenever a chat association changes.
+        self._assoc_cache: Dict[Tuple[str, EFBChannelChatIDStr], List[EFBChannelChatIDStr]] = {}
+        self._assoc_cache_gen = 0
+        self._assoc_cache_lock = threading.Lock()
+
         self.logger.debug("Loading database...")
         database.init(str(base_path / 'tgdata.db'))
         database.start()
@@ -263,10 +270,12 @@ class DatabaseManager:
         if not multiple_slave:
             self.remove_chat_assoc(master_uid=master_uid)
         self.remove_chat_assoc(slave_uid=slave_uid)
-        return ChatAssoc.create(master_uid=master_uid, slave_uid=slave_uid)
+        try:
+            return ChatAssoc.create(master_uid=master_uid, slave_uid=slave_uid)
+        finally:
+            self._invalidate_chat_assoc_cache()
 
-    @staticmethod
-    def remove_chat_assoc(master_uid: Optional[EFBChannelChatIDStr] = None,
+    def remove_chat_assoc(self, master_uid: Optional[EFBChannelChatIDStr] = None,
                           slave_uid: Optional[EFBChannelChatIDStr] = None):
         """
         Remove chat associations (chat links).
@@ -285,6 +294,13 @@ class DatabaseManager:
                 return ChatAssoc.delete().where(ChatAssoc.slave_uid == slave_uid).execute()
         except DoesNotExist:
             return 0
+        finally:
+            self._invalidate_chat_assoc_cache()
+
+    def _invalidate_chat_assoc_cache(self):
+        with self._assoc_cache_lock:
+            self._assoc_cache.clear()
+            self._assoc_cache_gen += 1
 
     @staticmethod
     def get_master_msg_id(message: EFBMessage) -> Optional[EFBChannelChatIDStr]:
@@ -337,14 +353,16 @@ class DatabaseManager:
             return pickle.dumps(data)
         return None
 
-    @staticmethod
-    def get_chat_assoc(master_uid: Optional[EFBChannelChatIDStr] = None,
+    def get_chat_assoc(self, master_uid: Optional[EFBChannelChatIDStr] = None,
                        slave_uid: Optional[EFBChannelChatIDStr] = None
                        ) -> List[EFBChannelChatIDStr]:
         """
         Get chat association (chat link) information.
         Only one parameter is to be provided.
 
+        Results are cached in memory until any chat association is added
+        or removed.
+
         Args:
             master_uid (str): Master channel UID ("%(chat_id)s")
             slave_uid (str): Slave channel UID ("%(channel_id)s.%(chat_id)s")
@@ -352,10 +370,34 @@ class DatabaseManager:
         Returns:
             list: The counterpart ID.
         """
+        if bool(master_uid) == bool(slave_uid):
+            raise ValueError("Only one parameter is to be provided.")
+        key: Tuple[str, EFBChannelChatIDStr]
+        if master_uid:
+            key = ("master", master_uid)
+        else:
+            key = ("slave", slave_uid)  # type: ignore
+        with self._assoc_cache_lock:
+            cached = self._assoc_cache.get(key)
+            gen = self._assoc_cache_gen
+        if cached is not None:
+            return list(cached)
+        result = self._get_chat_assoc_uncached(master_uid, slave_uid)
+        with self._assoc_cache_lock:
+            # Do not cache the result if associations are changed during the query.
+            if gen == self._assoc_cache_gen:
+                self._assoc_cache[key] = result
+        return list(result)
+
+    @staticmethod
+    def _get_chat_assoc_uncached(master_uid: Optional[EFBChannelChatIDStr] = None,
+                                 slave_uid: Optional[EFBChannelChatIDStr] = None
+                                 ) -> List[EFBChannelChatIDStr]:
+        """Get chat association information from database.
+        Parameters are validated by :meth:`get_chat_assoc`.
+        """
         try:
-            if bool(master_uid) == bool(slave_uid):
-                raise ValueError("Only one parameter is to be provided.")
-            elif master_uid:
+            if master_uid:
                 slaves = ChatAssoc.select(ChatAssoc.slave_uid, ChatAssoc.master_uid)\
                     .where(ChatAssoc.master_uid == master_uid)
                 if len(slaves) > 0:
@@ -496,6 +538,36 @@ class DatabaseManager:
         except DoesNotExist:
             return None
 
+    @staticmethod
+    def get_slave_chats_info(keys: Collection[Tuple[ModuleID, ChatID]]
+                             ) -> Dict[Tuple[ModuleID, ChatID], SlaveChatInfo]:
+        """
+        Get cached info of multiple slave chats from database in one query.
+
+        Only chats without a group ID are matched, like
+        :meth:`get_slave_chat_info` without ``slave_chat_group_id``.
+
+        Args:
+            keys: Pairs of slave channel ID and slave chat ID.
+
+        Returns:
+            Dict[Tuple[ModuleID, ChatID], SlaveChatInfo]: The matching slave
+            chat info keyed by slave channel ID and slave chat ID.
+        """
+        keys = set(keys)
+        if not keys:
+            return {}
+        query = SlaveChatInfo.select() \
+            .where((SlaveChatInfo.slave_channel_id.in_([i[0] for i in keys])) &
+                   (SlaveChatInfo.slave_chat_uid.in_([i[1] for i in keys])) &
+                   (SlaveChatInfo.slave_chat_group_id.is_null()))
+        result: Dict[Tuple[ModuleID, ChatID], SlaveChatInfo] = {}
+        for row in query:
+            key = (row.slave_channel_id, row.slave_chat_uid)
+            if key in keys:
+                result.setdefault(key, row)
+        return result
+
     def set_slave_chat_info(self, chat_object: 'ETMChatType') -> SlaveChatInfo:
         """
         Insert or update slave chat info entry
@@ -67,6 +67,7 @@ class ETMMsg(Message):
             except BadRequest as e:
                 logger.exception("Bad request while trying to get file metadata: %s", e)
                 return
+            utils.ensure_mimetypes()
             if not self.mime:
                 ext = os.path.splitext(file_meta.file_path)[1]
                 mime = mimetypes.guess_type(file_meta.file_path, strict=False)[0]
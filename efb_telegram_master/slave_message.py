@@ -45,6 +45,10 @@ if TYPE_CHECKING:
 class SlaveMessageProcessor(LocaleMixin):
     """Process messages as Message objects from slave channels."""
 
+    FILE_MSG_TYPES = (MsgType.Sticker, MsgType.Image, MsgType.Animation,
+                      MsgType.File, MsgType.Voice, MsgType.Video)
+    """Types of messages that come with a file."""
+
     def __init__(self, channel: 'TelegramChannel'):
         self.channel: 'TelegramChannel' = channel
         self.bot: 'TelegramBotManager' = self.channel.bot_manager
@@ -167,6 +171,9 @@ class SlaveMessageProcessor(LocaleMixin):
 
         msg.text = msg.text or ""
 
+        if msg.type in self.FILE_MSG_TYPES:
+            utils.ensure_mimetypes()
+
         # Type dispatching
         if msg.type == MsgType.Text:
             tg_msg = self.slave_message_text(msg, tg_dest, msg_template, reactions, old_msg_id, target_msg_id,
@@ -256,7 +263,7 @@ class SlaveMessageProcessor(LocaleMixin):
         self.logger.debug("[%s] Message is in chat %s", xid, msg.chat)
 
         # Generate chat text template & Decide type target
-        tg_dest = TelegramChatID(self.channel.config['admins'][0])
+        tg_dest = TelegramChatID(self.channel.first_admin)
 
         if tg_chat:  # if this chat is linked
             tg_dest = TelegramChatID(int(utils.chat_id_str_to_id(tg_chat)[1]))
@@ -283,7 +290,7 @@ class SlaveMessageProcessor(LocaleMixin):
                 t += html.escape(text[prev:i[0]])
                 sub_chat = msg.substitutions[i]
                 if isinstance(sub_chat, SelfChatMember) or (isinstance(sub_chat, Chat) and sub_chat.has_self):
-                    t += f'<a href="tg://user?id={self.channel.config["admins"][0]}">'
+                    t += f'<a href="tg://user?id={self.channel.first_admin}">'
                     t += html.escape(text[i[0]:i[1]])
                     t += "</a>"
                 else:
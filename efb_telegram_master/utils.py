@@ -3,9 +3,11 @@
 import base64
 import json
 import logging
+import mimetypes
 import os
 import subprocess
 import sys
+import threading
 from io import BytesIO
 from shutil import copyfileobj
 from tempfile import NamedTemporaryFile
@@ -69,6 +71,21 @@ class ExperimentalFlagsManager(LocaleMixin):
         return self.config[flag_key]
 
 
+_mimetypes_ready = False
+_mimetypes_lock = threading.Lock()
+
+
+def ensure_mimetypes():
+    """Load predefined MIME types, only upon the first call."""
+    global _mimetypes_ready
+    if _mimetypes_ready:
+        return
+    with _mimetypes_lock:
+        if not _mimetypes_ready:
+            mimetypes.init(files=["mimetypes"])
+            _mimetypes_ready = True
+
+
 def b64en(s: str) -> str:
     return base64.urlsafe_b64encode(s.encode()).decode().rstrip("=")
 
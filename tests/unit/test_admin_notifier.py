@@ -0,0 +1,47 @@
+import time
+from unittest.mock import MagicMock
+
+from pytest import fixture
+
+from efb_telegram_master.admin_notifier import AdminNotifier
+
+
+@fixture(scope="function")
+def mock_channel():
+    channel = MagicMock()
+    channel.ngettext = lambda singular, plural, n: singular if n == 1 else plural
+    return channel
+
+
+def test_admin_notifier_coalesce_on_delay(mock_channel):
+    notifier = AdminNotifier(mock_channel, 1, max_size=20, max_delay=0.5)
+    notifier.notify("Error 1")
+    notifier.notify("Error 2")
+    mock_channel.bot_manager.send_message.assert_not_called()
+    time.sleep(1)
+    mock_channel.bot_manager.send_message.assert_called_once()
+    args, kwargs = mock_channel.bot_manager.send_message.call_args
+    assert args[0] == 1
+    assert "Error 1" in args[1] and "Error 2" in args[1]
+    assert kwargs["parse_mode"] == "HTML"
+
+
+def test_admin_notifier_flush_on_size(mock_channel):
+    notifier = AdminNotifier(mock_channel, 1, max_size=2, max_delay=60)
+    notifier.notify("Error 1")
+    notifier.notify("Error 2")
+    mock_channel.bot_manager.send_message.assert_called_once()
+
+
+def test_admin_notifier_single_message(mock_channel):
+    notifier = AdminNotifier(mock_channel, 1, max_size=20, max_delay=60)
+    notifier.notify("Error 1")
+    notifier.stop()
+    mock_channel.bot_manager.send_message.assert_called_once_with(1, "Error 1", parse_mode="HTML")
+
+
+def test_admin_notifier_send_after_stop(mock_channel):
+    notifier = AdminNotifier(mock_channel, 1, max_size=20, max_delay=60)
+    notifier.stop()
+    notifier.notify("Error 1")
+    mock_channel.bot_manager.send_message.assert_called_once_with(1, "Error 1", parse_mode="HTML")
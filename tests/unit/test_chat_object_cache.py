@@ -41,6 +41,36 @@ def test_chat_manager_build_dummy(chat_manager):
     assert generated.uid == id
 
 
+def test_chat_manager_get_chats(chat_manager, slave):
+    chat = slave.chat_with_alias
+    chat_manager.compound_enrol(chat)
+    missing_key = ("__module_id__", "__chat_id__")
+    chats = chat_manager.get_chats([(chat.module_id, chat.uid), missing_key])
+    assert chats[(chat.module_id, chat.uid)] == chat
+    assert chats[missing_key] is None
+
+
+def test_chat_manager_get_chats_from_db(chat_manager, slave):
+    chat_a = chat_manager.compound_enrol(PrivateChat(channel=slave, uid="__db_chat_a__", name="Chat A"))
+    chat_b = chat_manager.compound_enrol(PrivateChat(module_id="__module_b__", module_name="Module B",
+                                                     channel_emoji="", uid="__db_chat_b__", name="Chat B"))
+    chat_manager.db.set_slave_chat_info(chat_a)
+    chat_manager.db.set_slave_chat_info(chat_b)
+    key_a = chat_manager.get_cache_key(chat_a)
+    key_b = chat_manager.get_cache_key(chat_b)
+    del chat_manager.cache[key_a]
+    del chat_manager.cache[key_b]
+
+    # Module of chat A with ID of chat B
+    cross_key = (chat_a.module_id, chat_b.uid)
+    chats = chat_manager.get_chats([key_a, cross_key])
+    assert chats[key_a] == chat_a
+    assert chats[key_a] is not chat_a  # unpickled from database
+    assert chats[key_a].name == chat_a.name
+    assert chats[cross_key] is None
+    assert key_a in chat_manager.cache
+
+
 def test_chat_manager_update_chat_obj(chat_manager, slave):
     chat = PrivateChat(channel=slave, uid="unique_id", name="Chat name")
     chat_manager.compound_enrol(chat)
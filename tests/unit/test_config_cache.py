@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import fixture
+
+CONFIG = """\
+token: "__token__"
+admins: [1]
+flags:
+  auto_manage_tg_config:
+    auto_add_group_to_folder:
+      1: Private
+      2: Group
+"""
+
+
+@fixture(scope="function")
+def config_path(tmp_path: Path) -> Path:
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG)
+    return path
+
+
+def cache_path_of(config_path: Path) -> Path:
+    return config_path.with_name(config_path.name + ".cache.json")
+
+
+def test_config_cache_hit(channel, config_path):
+    data = channel._read_config_data(config_path)
+    assert cache_path_of(config_path).exists()
+    with patch("efb_telegram_master.YAML") as yaml:
+        assert channel._read_config_data(config_path) == data
+        yaml.assert_not_called()
+
+
+def test_config_cache_miss_on_mtime_change(channel, config_path):
+    channel._read_config_data(config_path)
+    stat = config_path.stat()
+    # Same size, different content and modification time
+    config_path.write_text(CONFIG.replace("__token__", "__other__"))
+    os.utime(str(config_path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    assert channel._read_config_data(config_path)['token'] == "__other__"
+
+
+def test_config_cache_miss_on_size_change(channel, config_path):
+    channel._read_config_data(config_path)
+    stat = config_path.stat()
+    # Different size, same modification time
+    config_path.write_text(CONFIG.replace("__token__", "__longer_token__"))
+    os.utime(str(config_path), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert channel._read_config_data(config_path)['token'] == "__longer_token__"
+
+
+def test_config_cache_folder_int_keys(channel, config_path):
+    channel._read_config_data(config_path)
+    data = channel._read_config_data(config_path)
+    folders = data['flags']['auto_manage_tg_config']['auto_add_group_to_folder']
+    assert folders == {1: "Private", 2: "Group"}
+
+
+def test_config_cache_skip_non_json(channel, config_path):
+    config_path.write_text(CONFIG + "timestamp: 2020-01-01 00:00:00\n")
+    data = channel._read_config_data(config_path)
+    assert data['timestamp'].year == 2020
+    assert not cache_path_of(config_path).exists()
+
+
+def test_config_cache_read_only_directory(channel, config_path):
+    config_path.parent.chmod(0o555)
+    try:
+        assert channel._read_config_data(config_path)['token'] == "__token__"
+    finally:
+        config_path.parent.chmod(0o755)
@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+from efb_telegram_master.utils import EFBChannelChatIDStr
+
+
+def test_chat_assoc_cache_invalidation(channel):
+    db = channel.db
+    master_uid = EFBChannelChatIDStr("__master__ __chat__")
+    slave_uid = EFBChannelChatIDStr("__slave__ __chat__")
+    assert db.get_chat_assoc(master_uid=master_uid) == []
+
+    db.add_chat_assoc(master_uid=master_uid, slave_uid=slave_uid)
+    assert db.get_chat_assoc(master_uid=master_uid) == [slave_uid]
+    assert db.get_chat_assoc(slave_uid=slave_uid) == [master_uid]
+
+    db.remove_chat_assoc(master_uid=master_uid)
+    assert db.get_chat_assoc(master_uid=master_uid) == []
+    assert db.get_chat_assoc(slave_uid=slave_uid) == []
+
+
+def test_chat_assoc_cache_hit(channel):
+    db = channel.db
+    master_uid = EFBChannelChatIDStr("__master__ __cached_chat__")
+    slave_uid = EFBChannelChatIDStr("__slave__ __cached_chat__")
+    db.add_chat_assoc(master_uid=master_uid, slave_uid=slave_uid)
+
+    with patch.object(db, "_get_chat_assoc_uncached",
+                      wraps=db._get_chat_assoc_uncached) as uncached:
+        assert db.get_chat_assoc(master_uid=master_uid) == [slave_uid]
+        assert db.get_chat_assoc(master_uid=master_uid) == [slave_uid]
+        uncached.assert_called_once()
+
+    db.remove_chat_assoc(master_uid=master_uid)
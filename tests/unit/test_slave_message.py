@@ -1,3 +1,5 @@
+import threading
+
 from pytest import fixture
 from telegram import InlineKeyboardMarkup, InlineKeyboardButton
 
@@ -184,3 +186,23 @@ def test_build_inline_keyboard_existing_buttons(build_inline_keyboard, private):
     assert "__text__" in seq
     assert "__template__" in seq
     assert "__reactions__" in seq
+
+
+def test_slave_message_auto_tg_manager_in_thread(channel):
+    """Slave messages are processed in threads of slave channels, where no
+    event loop is set.
+    """
+    result = {}
+
+    def target():
+        try:
+            result["manager"] = channel.slave_messages.auto_tg_manager
+            result["channel_manager"] = channel.auto_tg_manager
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    assert "error" not in result
+    assert result["manager"] is result["channel_manager"]